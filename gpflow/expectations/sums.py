@@ -1,5 +1,4 @@
 import itertools
-from functools import reduce
 
 import tensorflow as tf
 
@@ -23,7 +22,7 @@ def _E(p, kernel, _, __, ___, nghp=None):
     :return: N
     """
     exps = [expectation(p, k, nghp=nghp) for k in kernel.kernels]
-    return reduce(tf.add, exps)
+    return tf.add_n(exps)
 
 
 @dispatch.expectation.register(Gaussian, kernels.Sum, InducingPoints, NoneType, NoneType)
@@ -36,7 +35,7 @@ def _E(p, kernel, inducing_variable, _, __, nghp=None):
     :return: NxM
     """
     exps = [expectation(p, (k, inducing_variable), nghp=nghp) for k in kernel.kernels]
-    return reduce(tf.add, exps)
+    return tf.add_n(exps)
 
 
 @dispatch.expectation.register(Gaussian, (mfn.Linear, mfn.Identity, mfn.Constant), NoneType, kernels.Sum,
@@ -50,7 +49,7 @@ def _E(p, mean, _, kernel, inducing_variable, nghp=None):
     :return: NxQxM
     """
     exps = [expectation(p, mean, (k, inducing_variable), nghp=nghp) for k in kernel.kernels]
-    return reduce(tf.add, exps)
+    return tf.add_n(exps)
 
 
 @dispatch.expectation.register(MarkovGaussian, mfn.Identity, NoneType, kernels.Sum, InducingPoints)
@@ -63,7 +62,7 @@ def _E(p, mean, _, kernel, inducing_variable, nghp=None):
     :return: NxDxM
     """
     exps = [expectation(p, mean, (k, inducing_variable), nghp=nghp) for k in kernel.kernels]
-    return reduce(tf.add, exps)
+    return tf.add_n(exps)
 
 
 @dispatch.expectation.register((Gaussian, DiagonalGaussian), kernels.Sum, InducingPoints, kernels.Sum, InducingPoints)
@@ -73,20 +72,41 @@ def _E(p, kern1, feat1, kern2, feat2, nghp=None):
     expectation[n] = <(\Sum_i K1_i_{Z1, x_n}) (\Sum_j K2_j_{x_n, Z2})>_p(x_n)
         - \Sum_i K1_i_{.,.}, \Sum_j K2_j_{.,.} :: Sum kernels
 
+    The transposes are only exploited when the very same kernel and inducing
+    variable objects are passed; equal but distinct objects take the general path.
+
     :return: NxM1xM2
     """
-    crossexps = []
-
-    if kern1 == kern2 and feat1 == feat2:  # avoid duplicate computation by using transposes
+    if kern1 is kern2 and feat1 is feat2:  # avoid duplicate computation by using transposes
+        crossexps = []
+        offdiagexps = []
         for i, k1 in enumerate(kern1.kernels):
             crossexps.append(expectation(p, (k1, feat1), (k1, feat1), nghp=nghp))
 
             for k2 in kern1.kernels[:i]:
-                eKK = expectation(p, (k1, feat1), (k2, feat2), nghp=nghp)
-                eKK += tf.linalg.adjoint(eKK)
-                crossexps.append(eKK)
-    else:
-        for k1, k2 in itertools.product(kern1.kernels, kern2.kernels):
-            crossexps.append(expectation(p, (k1, feat1), (k2, feat2), nghp=nghp))
-
-    return reduce(tf.add, crossexps)
+                offdiagexps.append(expectation(p, (k1, feat1), (k2, feat2), nghp=nghp))
+
+        if offdiagexps:  # the transpose distributes over the sum, so take it only once
+            eKK = tf.add_n(offdiagexps)
+            crossexps.append(eKK + tf.linalg.adjoint(eKK))
+        return tf.add_n(crossexps)
+
+    if feat1 is not feat2:
+        return tf.add_n([
+            expectation(p, (k1, feat1), (k2, feat2), nghp=nghp)
+            for k1, k2 in itertools.product(kern1.kernels, kern2.kernels)
+        ])
+
+    # with shared inducing variables, a pair whose swapped counterpart has
+    # already been computed is just its transpose
+    pairexps = {}
+    crossexps = []
+    for k1, k2 in itertools.product(kern1.kernels, kern2.kernels):
+        swapped = (id(k2), id(k1))
+        if swapped in pairexps:
+            crossexps.append(tf.linalg.adjoint(pairexps[swapped]))
+        else:
+            eKK = expectation(p, (k1, feat1), (k2, feat2), nghp=nghp)
+            pairexps[(id(k1), id(k2))] = eKK
+            crossexps.append(eKK)
+    return tf.add_n(crossexps)
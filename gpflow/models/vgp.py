@@ -53,11 +53,17 @@ class VGP(GPModel):
                  kernel: Kernel,
                  likelihood: Likelihood,
                  mean_function: Optional[MeanFunction] = None,
-                 num_latent: Optional[int] = None):
+                 num_latent: Optional[int] = None,
+                 cholesky_dtype: Optional[tf.DType] = None):
         """
         X is a data matrix, size [N, D]
         Y is a data matrix, size [N, R]
         kernel, likelihood, mean_function are appropriate GPflow objects
+        cholesky_dtype is the dtype in which the N x N Cholesky factorisation of
+        log_likelihood is computed, defaults to default_float(). Using float32 trades
+        accuracy for speed when N is large, and usually needs a larger jitter; a
+        factorisation that fails in the reduced precision raises an error rather than
+        returning NaN. predict_f is unaffected and always works in default_float().
 
         """
         super().__init__(kernel, likelihood, mean_function, num_latent)
@@ -66,10 +72,11 @@ class VGP(GPModel):
         num_data = x_data.shape[0]
         self.num_data = num_data
         self.num_latent = num_latent or y_data.shape[1]
+        self.cholesky_dtype = default_float() if cholesky_dtype is None else cholesky_dtype
         self.data = data
 
         self.q_mu = Parameter(np.zeros((num_data, self.num_latent)))
-        q_sqrt = np.array([np.eye(num_data) for _ in range(self.num_latent)])
+        q_sqrt = np.tile(np.eye(num_data)[None, ...], [self.num_latent, 1, 1])
         self.q_sqrt = Parameter(q_sqrt, transform=triangular())
 
     def log_likelihood(self):
@@ -90,15 +97,16 @@ class VGP(GPModel):
         KL = gauss_kl(self.q_mu, self.q_sqrt)
 
         # Get conditionals
-        K = self.kernel(x_data) + tf.eye(self.num_data, dtype=default_float()) * default_jitter()
-        L = tf.linalg.cholesky(K)
+        K = self.kernel(x_data)
+        K = tf.linalg.set_diag(K, tf.linalg.diag_part(K) + default_jitter())
+        L = tf.linalg.cholesky(tf.cast(K, self.cholesky_dtype))
+        if tf.as_dtype(self.cholesky_dtype) != tf.as_dtype(default_float()):
+            L = tf.debugging.assert_all_finite(L, "Cholesky of K failed in cholesky_dtype, try a larger jitter")
+        L = tf.cast(L, default_float())
         fmean = tf.linalg.matmul(L, self.q_mu) + self.mean_function(x_data)  # [NN, ND] -> ND
-        q_sqrt_dnn = tf.linalg.band_part(self.q_sqrt, -1, 0)  # [D, N, N]
-        L_tiled = tf.tile(tf.expand_dims(L, 0), tf.stack([self.num_latent, 1, 1]))
-        LTA = tf.linalg.matmul(L_tiled, q_sqrt_dnn)  # [D, N, N]
-        fvar = tf.reduce_sum(tf.square(LTA), 2)
-
-        fvar = tf.transpose(fvar)
+        # the triangular() transform already zeroes the upper triangle of q_sqrt
+        LTA = tf.linalg.matmul(L[None, ...], self.q_sqrt)  # [D, N, N]
+        fvar = tf.einsum('dij,dij->id', LTA, LTA)  # diag(L q_sqrt q_sqrt^T L^T), [N, D]
 
         # Get variational expectations.
         var_exp = self.likelihood.variational_expectations(fmean, fvar, y_data)
@@ -149,11 +157,16 @@ class VGPOpperArchambeau(GPModel):
                  kernel: Kernel,
                  likelihood: Likelihood,
                  mean_function: MeanFunction = None,
-                 num_latent: Optional[int] = None):
+                 num_latent: Optional[int] = None,
+                 cholesky_dtype: Optional[tf.DType] = None):
         """
         X is a data matrix, size [N, D]
         Y is a data matrix, size [N, R]
         kernel, likelihood, mean_function are appropriate GPflow objects
+        cholesky_dtype is the dtype in which the [R, N, N] Cholesky factorisations
+        and triangular solves are computed, defaults to default_float(). Below
+        default_float(), the marginal variances are formed without a cancelling
+        subtraction at the cost of one extra batched N x N matmul.
         """
         mean_function = Zero() if mean_function is None else mean_function
 
@@ -163,6 +176,8 @@ class VGPOpperArchambeau(GPModel):
         self.data = data
         self.num_data = x_data.shape[0]
         self.num_latent = num_latent or y_data.shape[1]
+        self.cholesky_dtype = default_float() if cholesky_dtype is None else cholesky_dtype
+        self._eye = tf.eye(self.num_data, dtype=self.cholesky_dtype)[None, ...]  # [1, N, N]
         self.q_alpha = Parameter(np.zeros((self.num_data, self.num_latent)))
         self.q_lambda = Parameter(np.ones((self.num_data, self.num_latent)), transform=gpflow.utilities.positive())
 
@@ -180,17 +195,26 @@ class VGPOpperArchambeau(GPModel):
         K_alpha = tf.linalg.matmul(K, self.q_alpha)
         f_mean = K_alpha + self.mean_function(x_data)
 
-        # compute the variance for each of the outputs
-        I = tf.tile(tf.eye(self.num_data, dtype=default_float())[None, ...], [self.num_latent, 1, 1])
-        A = I + tf.transpose(self.q_lambda)[:, None, ...] * tf.transpose(self.q_lambda)[:, :, None, ...] * K
+        # compute the variance for each of the outputs, factorising A in cholesky_dtype
+        lambda_t = tf.cast(tf.transpose(self.q_lambda), self.cholesky_dtype)
+        lambda_K_lambda = tf.einsum('dn,dm,nm->dnm', lambda_t, lambda_t, tf.cast(K, self.cholesky_dtype))
+        A = tf.linalg.set_diag(lambda_K_lambda, tf.linalg.diag_part(lambda_K_lambda) + 1.)  # A = I + lambda_K_lambda
         L = tf.linalg.cholesky(A)
-        Li = tf.linalg.triangular_solve(L, I)
-        tmp = Li / tf.transpose(self.q_lambda)[:, None, ...]
-        f_var = 1. / tf.square(self.q_lambda) - tf.transpose(tf.reduce_sum(tf.square(tmp), 1))
+        Li = tf.linalg.triangular_solve(L, self._eye)
+        # diag(A^-1) are the column sums of Li**2, and tr(A^-1) is their total,
+        # so a single squared reduction of Li serves both f_var and the KL
+        diag_Ai = tf.reduce_sum(tf.square(Li), 1)  # [D, N]
+        if tf.as_dtype(self.cholesky_dtype) != tf.as_dtype(default_float()):
+            # 1 - diag(A^-1) cancels when lambda**2 K is small; diag(A^-1 (A - I)) avoids the subtraction
+            one_minus_diag_Ai = tf.reduce_sum(Li * tf.linalg.matmul(Li, lambda_K_lambda), 1)
+        else:
+            one_minus_diag_Ai = 1. - diag_Ai
+        f_var = tf.cast(tf.transpose(one_minus_diag_Ai), default_float()) / tf.square(self.q_lambda)
 
         # some statistics about A are used in the KL
-        A_logdet = 2.0 * tf.reduce_sum(tf.math.log(tf.linalg.diag_part(L)))
-        trAi = tf.reduce_sum(tf.square(Li))
+        L_diag = tf.cast(tf.linalg.diag_part(L), default_float())
+        A_logdet = 2.0 * tf.reduce_sum(tf.math.log(L_diag))
+        trAi = tf.reduce_sum(tf.cast(diag_Ai, default_float()))
 
         KL = 0.5 * (A_logdet + trAi - self.num_data * self.num_latent + tf.reduce_sum(K_alpha * self.q_alpha))
 
@@ -216,12 +240,13 @@ class VGPOpperArchambeau(GPModel):
         f_mean = tf.linalg.matmul(Kx, self.q_alpha, transpose_a=True) + self.mean_function(predict_at)
 
         # predictive var
-        A = K + tf.linalg.diag(tf.transpose(1. / tf.square(self.q_lambda)))
-        L = tf.linalg.cholesky(A)
-        Kx_tiled = tf.tile(Kx[None, ...], [self.num_latent, 1, 1])
-        LiKx = tf.linalg.triangular_solve(L, Kx_tiled)
+        A = tf.broadcast_to(K, [self.num_latent, self.num_data, self.num_data])
+        A = tf.linalg.set_diag(A, tf.linalg.diag_part(K) + tf.transpose(1. / tf.square(self.q_lambda)))
+        L = tf.linalg.cholesky(tf.cast(A, self.cholesky_dtype))
+        LiKx = tf.linalg.triangular_solve(L, tf.cast(Kx, self.cholesky_dtype)[None, ...])
+        LiKx = tf.cast(LiKx, default_float())
         if full_cov:
             f_var = self.kernel(predict_at) - tf.linalg.matmul(LiKx, LiKx, transpose_a=True)
         else:
-            f_var = self.kernel(predict_at, full=False) - tf.reduce_sum(tf.square(LiKx), 1)
+            f_var = self.kernel(predict_at, full=False) - tf.einsum('dnm,dnm->dm', LiKx, LiKx)
         return f_mean, tf.transpose(f_var)
@@ -247,6 +247,14 @@ def test_eKzxKxz_different_sum_kernels(distribution, kern1, kern2, inducing_vari
     _check((distribution, (kern1, inducing_variable), (kern2, inducing_variable)))
 
 
+@pytest.mark.parametrize("distribution", distr_args1)
+def test_eKzxKxz_sum_kernels_sharing_components(distribution, inducing_variable):
+    # the second sum reuses the components of the first in swapped order
+    kern1 = kernels.Sum(kerns("rbf", "lin"))
+    kern2 = kernels.Sum(kerns("lin", "rbf", "matern"))
+    _check((distribution, (kern1, inducing_variable), (kern2, inducing_variable)))
+
+
 @pytest.mark.parametrize("distribution", distr_args1)
 @pytest.mark.parametrize("kern1", kerns("rbf_lin_sum2"))
 @pytest.mark.parametrize("kern2", kerns("rbf_lin_sum2"))
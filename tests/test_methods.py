@@ -232,3 +232,107 @@ def test_sparse_mcmc_likelihoods_and_gradients():
     model_2.kernel.variance.assign(4.2)
 
     assert_allclose(model_1.log_likelihood(), model_2.log_likelihood(), rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize('model_class', [gpflow.models.VGP, gpflow.models.VGPOpperArchambeau])
+def test_vgp_compiled_predict_f(model_class):
+    """
+    Callers compile prediction themselves; a compiled predict_f must handle varying numbers of points.
+    """
+    X, Y = rng.randn(20, 1), rng.randn(20, 1)
+    model = model_class((X, Y), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian())
+    compiled_predict_f = tf.function(model.predict_f)
+    for num_points in [5, 7, 9]:
+        Xnew = rng.randn(num_points, 1)
+        mf, vf = compiled_predict_f(Xnew)
+        mf_eager, vf_eager = model.predict_f(Xnew)
+        assert_allclose(mf, mf_eager)
+        assert_allclose(vf, vf_eager)
+
+
+@pytest.mark.parametrize('model_class', [gpflow.models.VGP, gpflow.models.VGPOpperArchambeau])
+def test_vgp_variable_data(model_class):
+    """
+    Data held in tf.Variables is read on every call, so assigning to it changes the bound.
+    """
+    X, Y1, Y2 = rng.randn(10, 1), rng.randn(10, 1), rng.randn(10, 1)
+    Xv = tf.Variable(X, trainable=False)
+    Yv = tf.Variable(Y1, trainable=False)
+    model = model_class((Xv, Yv), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian())
+    model.log_likelihood()
+    Yv.assign(Y2)
+    reference_model = model_class((X, Y2), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian())
+    assert_allclose(model.log_likelihood(), reference_model.log_likelihood())
+
+
+@pytest.mark.parametrize('model_class', [gpflow.models.VGP, gpflow.models.VGPOpperArchambeau])
+def test_vgp_cholesky_dtype(model_class):
+    """
+    Factorising in single precision should only perturb the bound and the predictions slightly.
+    """
+    X, Y = rng.randn(20, 1), rng.randn(20, 2)
+    model_1 = model_class((X, Y), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian())
+    model_2 = model_class((X, Y), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian(),
+                          cholesky_dtype=tf.float32)
+    with gpflow.config.as_context(gpflow.config.Config(jitter=1e-4)):
+        assert_allclose(model_1.log_likelihood(), model_2.log_likelihood(), rtol=1e-4)
+        mu_1, var_1 = model_1.predict_f(Datum.Xs[:, :1])
+        mu_2, var_2 = model_2.predict_f(Datum.Xs[:, :1])
+    assert mu_2.dtype == default_float()
+    assert_allclose(mu_1, mu_2, rtol=1e-4, atol=1e-4)
+    assert_allclose(var_1, var_2, rtol=1e-3, atol=1e-3)
+
+
+def test_vgp_cholesky_dtype_jitter_change():
+    """
+    A larger jitter set after the first call must still be used by later calls.
+    """
+    X, Y = rng.randn(5, 1) * 3., rng.randn(5, 1)
+    model = gpflow.models.VGP((X, Y), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian(),
+                              cholesky_dtype=tf.float32)
+    default_jitter_bound = model.log_likelihood()
+    with gpflow.config.as_context(gpflow.config.Config(jitter=1e-1)):
+        large_jitter_bound = model.log_likelihood()
+        reference_model = gpflow.models.VGP((X, Y), gpflow.kernels.SquaredExponential(),
+                                            gpflow.likelihoods.Gaussian())
+        assert_allclose(large_jitter_bound, reference_model.log_likelihood(), rtol=1e-5)
+    assert not np.allclose(default_jitter_bound, large_jitter_bound)
+
+
+def test_vgp_cholesky_dtype_failure_raises():
+    """
+    With the default jitter, a single precision factorisation of a large, badly conditioned K
+    must fail loudly instead of returning NaN.
+    """
+    X, Y = rng.rand(200, 1), rng.randn(200, 1)
+    model = gpflow.models.VGP((X, Y), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian(),
+                              cholesky_dtype=tf.float32)
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        model.log_likelihood()
+
+
+def test_vgp_opper_archambeau_cholesky_dtype_small_lambda():
+    """
+    Small q_lambda makes A close to the identity; the single precision bound must still match.
+    """
+    X, Y = rng.randn(10, 1), (rng.rand(10, 1) > 0.5).astype(default_float())
+    models = [
+        gpflow.models.VGPOpperArchambeau((X, Y), gpflow.kernels.SquaredExponential(),
+                                         gpflow.likelihoods.Bernoulli(), cholesky_dtype=dtype)
+        for dtype in [default_float(), tf.float32]
+    ]
+    for model in models:
+        model.q_lambda.assign(np.full((10, 1), 1e-3))
+    assert_allclose(models[0].log_likelihood(), models[1].log_likelihood(), rtol=1e-5)
+
+
+def test_vgp_q_sqrt_lower_triangular():
+    """
+    VGP relies on the triangular() transform to keep q_sqrt lower triangular,
+    even when a full matrix is assigned.
+    """
+    X, Y = rng.randn(5, 1), rng.randn(5, 2)
+    model = gpflow.models.VGP((X, Y), gpflow.kernels.SquaredExponential(), gpflow.likelihoods.Gaussian())
+    model.q_sqrt.assign(rng.randn(2, 5, 5))
+    q_sqrt = model.q_sqrt.numpy()
+    assert_array_equal(np.triu(q_sqrt, 1), np.zeros_like(q_sqrt))